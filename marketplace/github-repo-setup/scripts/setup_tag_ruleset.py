@@ -24,9 +24,10 @@ Requirements:
 
 import argparse
 import json
-import subprocess
 import sys
 from dataclasses import dataclass
+from functools import cache
+from itertools import product
 
 
 @dataclass
@@ -73,13 +74,17 @@ VERSION_FORMATS = {
 }
 
 
-def generate_digit_patterns(max_digits: int) -> list[str]:
+@cache
+def generate_digit_patterns(max_digits: int) -> tuple[str, ...]:
     """
     Generate fnmatch patterns for 1 to max_digits digits.
 
-    Example: max_digits=3 returns ["[0-9]", "[0-9][0-9]", "[0-9][0-9][0-9]"]
+    Example: max_digits=3 returns ("[0-9]", "[0-9][0-9]", "[0-9][0-9][0-9]")
+
+    Segments share digit counts (e.g. XX and YY), so results are cached; they
+    are returned as tuples so the cached value can't be modified.
     """
-    return ["[0-9]" * i for i in range(1, max_digits + 1)]
+    return tuple("[0-9]" * i for i in range(1, max_digits + 1))
 
 
 def generate_version_patterns(version_format: VersionFormat) -> list[str]:
@@ -88,29 +93,17 @@ def generate_version_patterns(version_format: VersionFormat) -> list[str]:
 
     For vXX.YY.ZZZ (max digits [2, 2, 3]): 2 * 2 * 3 = 12 patterns
     For vXX.ZZZ (max digits [2, 3]): 2 * 3 = 6 patterns
+
+    Ruleset patterns have no optional-character syntax ("?" matches any one
+    character), so each digit count needs a pattern of its own.
     """
     segment_patterns = [
         generate_digit_patterns(max_digits)
         for max_digits in version_format.segment_max_digits
     ]
 
-    # Generate all combinations using itertools-like approach
-    def product(*iterables):
-        """Cartesian product of input iterables."""
-        result = [[]]
-        for pool in iterables:
-            result = [x + [y] for x in result for y in pool]
-        return result
-
-    combinations = product(*segment_patterns)
-
-    patterns = []
-    for combo in combinations:
-        version_part = ".".join(combo)
-        pattern = f"refs/tags/{version_format.prefix}{version_part}"
-        patterns.append(pattern)
-
-    return patterns
+    tag_prefix = "refs/tags/" + version_format.prefix
+    return [tag_prefix + ".".join(combo) for combo in product(*segment_patterns)]
 
 
 def create_ruleset_payload(
@@ -144,34 +137,16 @@ def create_ruleset_payload(
 def get_first_commit(owner: str, repo: str) -> str | None:
     """Get the SHA of the first commit in the repository's default branch."""
     import re
+    import subprocess
 
-    # First get the default branch
-    result = subprocess.run(
-        [
-            "gh", "api",
-            "-H", "Accept: application/vnd.github+json",
-            "-H", "X-GitHub-Api-Version: 2022-11-28",
-            f"/repos/{owner}/{repo}",
-            "--jq", ".default_branch",
-        ],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        print(f"Error getting default branch: {result.stderr}", file=sys.stderr)
-        return None
-
-    default_branch = result.stdout.strip()
-
-    # Get commits, paginate to find the first one
-    # Use per_page=1 and get the Link header to find total pages
+    # Get commits on the default branch (the API's default when no sha is
+    # given). Use per_page=1 and get the Link header to find total pages
     result = subprocess.run(
         [
             "gh", "api",
             "-H", "Accept: application/vnd.github+json",
             "-H", "X-GitHub-Api-Version: 2022-11-28",
-            f"/repos/{owner}/{repo}/commits?sha={default_branch}&per_page=1",
+            f"/repos/{owner}/{repo}/commits?per_page=1",
             "-i",  # Include headers
         ],
         capture_output=True,
@@ -195,7 +170,7 @@ def get_first_commit(owner: str, repo: str) -> str | None:
             "gh", "api",
             "-H", "Accept: application/vnd.github+json",
             "-H", "X-GitHub-Api-Version: 2022-11-28",
-            f"/repos/{owner}/{repo}/commits?sha={default_branch}&per_page=1&page={last_page}",
+            f"/repos/{owner}/{repo}/commits?per_page=1&page={last_page}",
             "--jq", ".[0].sha",
         ],
         capture_output=True,
@@ -211,6 +186,8 @@ def get_first_commit(owner: str, repo: str) -> str | None:
 
 def check_tag_exists(owner: str, repo: str, tag_name: str) -> bool:
     """Check if a tag already exists in the repository."""
+    import subprocess
+
     result = subprocess.run(
         [
             "gh", "api",
@@ -228,13 +205,15 @@ def create_initial_tag(
     owner: str, repo: str, tag_name: str, commit_sha: str, message: str
 ) -> tuple[bool, str]:
     """Create an annotated tag on the specified commit via GitHub API."""
+    import subprocess
+
     # First create the tag object
     tag_payload = json.dumps({
         "tag": tag_name,
         "message": message,
         "object": commit_sha,
         "type": "commit",
-    })
+    }).encode()
 
     result = subprocess.run(
         [
@@ -247,11 +226,10 @@ def create_initial_tag(
         ],
         input=tag_payload,
         capture_output=True,
-        text=True,
     )
 
     if result.returncode != 0:
-        return False, result.stderr
+        return False, result.stderr.decode()
 
     tag_response = json.loads(result.stdout)
     tag_sha = tag_response.get("sha")
@@ -260,7 +238,7 @@ def create_initial_tag(
     ref_payload = json.dumps({
         "ref": f"refs/tags/{tag_name}",
         "sha": tag_sha,
-    })
+    }).encode()
 
     result = subprocess.run(
         [
@@ -273,17 +251,18 @@ def create_initial_tag(
         ],
         input=ref_payload,
         capture_output=True,
-        text=True,
     )
 
     if result.returncode == 0:
-        return True, result.stdout
+        return True, result.stdout.decode()
     else:
-        return False, result.stderr
+        return False, result.stderr.decode()
 
 
 def check_existing_rulesets(owner: str, repo: str) -> list[dict]:
     """Check for existing rulesets in the repository."""
+    import subprocess
+
     result = subprocess.run(
         [
             "gh", "api",
@@ -292,56 +271,66 @@ def check_existing_rulesets(owner: str, repo: str) -> list[dict]:
             f"/repos/{owner}/{repo}/rulesets",
         ],
         capture_output=True,
-        text=True,
     )
 
     if result.returncode != 0:
-        print(f"Error checking existing rulesets: {result.stderr}", file=sys.stderr)
+        print(f"Error checking existing rulesets: {result.stderr.decode()}", file=sys.stderr)
         return []
 
+    # json.loads takes the UTF-8 bytes directly, no decoded copy needed
     return json.loads(result.stdout)
 
 
-def delete_ruleset(owner: str, repo: str, ruleset_id: int) -> bool:
-    """Delete an existing ruleset."""
+def create_ruleset(owner: str, repo: str, payload: dict) -> tuple[bool, str]:
+    """Create the ruleset via GitHub API."""
+    import subprocess
+
+    payload_json = json.dumps(payload).encode()
+
     result = subprocess.run(
         [
             "gh", "api",
-            "--method", "DELETE",
+            "--method", "POST",
             "-H", "Accept: application/vnd.github+json",
             "-H", "X-GitHub-Api-Version: 2022-11-28",
-            f"/repos/{owner}/{repo}/rulesets/{ruleset_id}",
+            f"/repos/{owner}/{repo}/rulesets",
+            "--input", "-",
         ],
+        input=payload_json,
         capture_output=True,
-        text=True,
     )
 
-    return result.returncode == 0
+    if result.returncode == 0:
+        return True, result.stdout.decode()
+    else:
+        return False, result.stderr.decode()
 
 
-def create_ruleset(owner: str, repo: str, payload: dict) -> tuple[bool, str]:
-    """Create the ruleset via GitHub API."""
+def update_ruleset(
+    owner: str, repo: str, ruleset_id: int, payload: dict
+) -> tuple[bool, str]:
+    """Replace an existing ruleset's configuration via GitHub API."""
+    import subprocess
 
-    payload_json = json.dumps(payload)
+    payload_json = json.dumps(payload).encode()
 
     result = subprocess.run(
         [
             "gh", "api",
-            "--method", "POST",
+            "--method", "PUT",
             "-H", "Accept: application/vnd.github+json",
             "-H", "X-GitHub-Api-Version: 2022-11-28",
-            f"/repos/{owner}/{repo}/rulesets",
+            f"/repos/{owner}/{repo}/rulesets/{ruleset_id}",
             "--input", "-",
         ],
         input=payload_json,
         capture_output=True,
-        text=True,
     )
 
     if result.returncode == 0:
-        return True, result.stdout
+        return True, result.stdout.decode()
     else:
-        return False, result.stderr
+        return False, result.stderr.decode()
 
 
 def main():
@@ -461,16 +450,12 @@ Supported formats:
         return
 
     # Check for existing rulesets
+    existing_id = None
     existing = check_existing_rulesets(args.owner, args.repo)
     for ruleset in existing:
         if ruleset.get("name") == ruleset_name:
             if args.replace:
-                print(f"Deleting existing ruleset '{ruleset_name}' (id: {ruleset['id']})...")
-                if delete_ruleset(args.owner, args.repo, ruleset["id"]):
-                    print("  Deleted successfully")
-                else:
-                    print("  Failed to delete", file=sys.stderr)
-                    sys.exit(1)
+                existing_id = ruleset["id"]
             else:
                 print(
                     f"Error: Ruleset '{ruleset_name}' already exists. "
@@ -479,14 +464,23 @@ Supported formats:
                 )
                 sys.exit(1)
 
-    # Create the ruleset
-    print(f"Creating tag ruleset for {args.owner}/{args.repo}...")
-    print(f"Format: {version_format.name} ({version_format.description})")
-    success, output = create_ruleset(args.owner, args.repo, payload)
+    if existing_id is None:
+        # Create the ruleset
+        print(f"Creating tag ruleset for {args.owner}/{args.repo}...")
+        print(f"Format: {version_format.name} ({version_format.description})")
+        success, output = create_ruleset(args.owner, args.repo, payload)
+        action = "created"
+    else:
+        # Update the existing ruleset in place, so the repository is never
+        # left without one between a delete and a create
+        print(f"Replacing existing ruleset '{ruleset_name}' (id: {existing_id})...")
+        print(f"Format: {version_format.name} ({version_format.description})")
+        success, output = update_ruleset(args.owner, args.repo, existing_id, payload)
+        action = "updated"
 
     if success:
         response = json.loads(output)
-        print(f"\nSuccessfully created ruleset '{ruleset_name}' (id: {response.get('id')})")
+        print(f"\nSuccessfully {action} ruleset '{ruleset_name}' (id: {response.get('id')})")
         print("\nRuleset configuration:")
         print("  - Targets: All tags (refs/tags/*)")
         print(f"  - Excludes: {len(payload['conditions']['ref_name']['exclude'])} valid version patterns")
@@ -494,7 +488,8 @@ Supported formats:
         print(f"\nValid tag examples: {', '.join(version_format.examples_valid)}")
         print(f"Blocked tag examples: {', '.join(version_format.examples_invalid)}")
     else:
-        print(f"Failed to create ruleset: {output}", file=sys.stderr)
+        verb = "create" if existing_id is None else "update"
+        print(f"Failed to {verb} ruleset: {output}", file=sys.stderr)
         sys.exit(1)
 
 
@@ -46,6 +46,15 @@ SSH_FLAGS_WITH_ARG = set('bcDEeFIiJLlmOopQRSwWo')
 # SSH flags that do NOT take an argument
 SSH_FLAGS_NO_ARG = set('46AaCfGgKkMNnqsTtVvXxYy')
 
+# scp/rsync remote target: [user@]host:path
+REMOTE_TARGET = re.compile(r'^(?:([^@:]+)@)?([^@:/][^@:]*):(.*)$')
+
+# Environment variable assignment prefix: VAR=val
+ENV_ASSIGNMENT = re.compile(r'^[A-Za-z_]\w*=')
+
+# sudo anywhere in a remote command
+SUDO_WORD = re.compile(r'\bsudo\b')
+
 
 def load_config():
     """Load allowed hosts config. Returns [] on any error."""
@@ -196,7 +205,7 @@ def parse_scp_rsync_targets(tokens):
         # Match user@host:path or host:path
         # But not absolute paths like /tmp/foo or relative paths
         # Also not URLs like http://...
-        match = re.match(r'^(?:([^@:]+)@)?([^@:/][^@:]*):(.*)$', token)
+        match = REMOTE_TARGET.match(token)
         if match:
             user = match.group(1)
             host = match.group(2)
@@ -289,7 +298,7 @@ def strip_privilege_prefixes(tokens):
         if tokens[0] and '=' in tokens[0] and not tokens[0].startswith('-'):
             # Could be env FOO=bar cmd — skip the assignment
             # But only if it looks like VAR=val (starts with letter/underscore)
-            if re.match(r'^[A-Za-z_]\w*=', tokens[0]):
+            if ENV_ASSIGNMENT.match(tokens[0]):
                 tokens = tokens[1:]
                 continue
         break
@@ -347,7 +356,7 @@ def check_command(command, config):
         # Check if this command requires root-level access:
         # either logging in as root, or sudo anywhere in the remote command.
         remote_str = ' '.join(remote_cmd)
-        uses_sudo = bool(re.search(r'\bsudo\b', remote_str))
+        uses_sudo = bool(SUDO_WORD.search(remote_str))
         needs_root = user == 'root' or uses_sudo
         if needs_root and not entry.get('permit-root-access', False):
             return False
@@ -11,7 +11,6 @@ Allows:
   - Normal script execution (`uv run python3 ./script.py`)
 """
 
-import json
 import re
 import sys
 
@@ -60,88 +59,75 @@ Or write the content to a file first using the Write tool."""
 
 # --- Patterns ---
 
-# python -c / python3 -c (with optional uv run prefix)
-PYTHON_DASH_C = re.compile(
-    r'(?:uv\s+run\s+)?python[23]?\s+-c\s',
-)
-
-# Heredoc with single-quoted delimiter — SAFE, allow these
-# Matches: <<'EOF', << 'EOF', <<-'EOF', <<- 'MARKER'
-# Requires << to be preceded by whitespace or start-of-string
-SAFE_HEREDOC = re.compile(
-    r"(?:^|\s)<<-?\s*'(\w+)'",
+# Both checks are fused into one alternation so the command is scanned once;
+# the named group that fired selects the deny message.
+DENY_PATTERN = re.compile(
+    # python -c / python3 -c (also catches them behind a uv run prefix)
+    r'(?P<python_c>python[23]?\s+-c\s)'
+    r'|'
+    # Heredoc whose delimiter isn't single-quoted
+    # Matches: << EOF, <<EOF, <<"EOF", <<-EOF, <<- "EOF", etc.
+    # Single-quoted delimiters (<<'EOF', <<- 'MARKER') never match because
+    # the delimiter must start with an optional " and a word character.
+    # Requires << to be preceded by whitespace or start-of-line
+    # (avoids matching << inside quoted strings like echo "use << for")
+    r'(?P<unsafe_heredoc>(?:^|\s)<<-?\s*"?\w)',
     re.MULTILINE,
 )
 
-# Any heredoc operator (to find ones that aren't single-quoted)
-# Matches: << EOF, <<EOF, <<"EOF", <<-EOF, <<- "EOF", etc.
-# Requires << to be preceded by whitespace or start-of-string
-# (avoids matching << inside quoted strings like echo "use << for")
-ANY_HEREDOC = re.compile(
-    r'(?:^|\s)(<<-?\s*"?\w)',
-    re.MULTILINE,
-)
+MESSAGES = {
+    "python_c": DENY_PYTHON_C,
+    "unsafe_heredoc": DENY_UNQUOTED_HEREDOC,
+}
 
+# Pre-encoded reply for the allow path
+ALLOW_RESPONSE = b"{}\n"
 
-def find_unsafe_heredocs(command):
-    """Check if command has heredocs that aren't single-quoted.
 
-    Returns True if there are unsafe (unquoted or double-quoted) heredocs.
-    """
-    # Find all heredoc positions
-    all_heredocs = list(ANY_HEREDOC.finditer(command))
-    if not all_heredocs:
-        return False
-
-    # Find all safe (single-quoted) heredoc positions
-    safe_positions = {m.start() for m in SAFE_HEREDOC.finditer(command)}
-
-    # If any heredoc start position isn't in the safe set, it's unsafe
-    for m in all_heredocs:
-        if m.start() not in safe_positions:
-            return True
+def main():
+    raw = sys.stdin.buffer.read()
 
-    return False
+    # Only Bash calls can be denied. Recognise everything else from the raw
+    # bytes, without importing json or decoding the payload.
+    if b'"Bash"' not in raw:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
 
+    import json
 
-def main():
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
-        print(json.dumps({}))
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get("tool_name", "")
     if tool_name != "Bash":
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     command = input_data.get("tool_input", {}).get("command", "")
 
-    # Check for python -c (always blocked)
-    if PYTHON_DASH_C.search(command):
-        print(json.dumps({
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "deny",
-            },
-            "systemMessage": DENY_PYTHON_C,
-        }))
+    # Cheap substring test first: neither check can match without these
+    if "-c" not in command and "<<" not in command:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
-    # Check for unsafe heredocs (unquoted or double-quoted delimiters)
-    if find_unsafe_heredocs(command):
-        print(json.dumps({
+    # Check for python -c and unsafe heredocs (unquoted or double-quoted
+    # delimiters) in a single pass
+    match = DENY_PATTERN.search(command)
+    if match:
+        sys.stdout.buffer.write(json.dumps({
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
             },
-            "systemMessage": DENY_UNQUOTED_HEREDOC,
-        }))
+            "systemMessage": MESSAGES[match.lastgroup],
+        }).encode() + b"\n")
         return
 
     # No match — allow
-    print(json.dumps({}))
+    sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tests for block_inline_scripts.py hook."""
+
+import io
+import json
+import os
+import sys
+
+# Import from same directory
+sys.path.insert(0, os.path.dirname(__file__))
+import block_inline_scripts
+
+
+def run_hook(stdin):
+    """Run the hook's main() on the given stdin text and return its output."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+    sys.stdout = io.TextIOWrapper(io.BytesIO())
+    try:
+        block_inline_scripts.main()
+        sys.stdout.flush()
+        output = sys.stdout.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+    return json.loads(output)
+
+
+def deny_message(command, tool_name='Bash'):
+    """Return the deny message for a tool call, or None if it is allowed."""
+    output = run_hook(json.dumps({
+        'tool_name': tool_name,
+        'tool_input': {'command': command},
+    }))
+    if not output:
+        return None
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    return output['systemMessage']
+
+
+# --- python -c ---
+
+def test_python_c():
+    """python -c is blocked."""
+    assert deny_message('python -c "print(1)"') == block_inline_scripts.DENY_PYTHON_C
+
+
+def test_python3_c():
+    """python3 -c is blocked."""
+    assert deny_message("python3 -c 'import sys'") == block_inline_scripts.DENY_PYTHON_C
+
+
+def test_uv_run_python_c():
+    """uv run python3 -c is blocked."""
+    assert deny_message("uv run python3 -c 'import sys'") == block_inline_scripts.DENY_PYTHON_C
+
+
+def test_python_script():
+    """Running a script file is allowed."""
+    assert deny_message('uv run python3 ./tmp/my_script.py') is None
+
+
+def test_python_module():
+    """python -m is allowed."""
+    assert deny_message('uv run python3 -m pytest -q') is None
+
+
+# --- Heredocs ---
+
+def test_heredoc_unquoted():
+    """<< EOF expands variables and is blocked."""
+    assert deny_message('cat << EOF\n$HOME\nEOF') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_heredoc_no_space():
+    """<<EOF is blocked."""
+    assert deny_message('cat <<EOF\nhi\nEOF') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_heredoc_double_quoted():
+    """<<"EOF" is blocked."""
+    assert deny_message('cat <<"EOF"\nhi\nEOF') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_heredoc_dash():
+    """<<-EOF is blocked."""
+    assert deny_message('cat <<-EOF\n\thi\nEOF') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_heredoc_single_quoted():
+    """<<'EOF' and <<- 'EOF' are allowed."""
+    assert deny_message("cat <<'EOF'\n$HOME\nEOF") is None
+    assert deny_message("cat <<- 'EOF'\n\t$HOME\nEOF") is None
+
+
+def test_heredoc_commit_message():
+    """$(cat <<'EOF' ...) for commit messages is allowed."""
+    command = 'git commit -m "$(cat <<\'EOF\'\nFix the thing\nEOF\n)"'
+    assert deny_message(command) is None
+
+
+def test_heredoc_later_line():
+    """An unquoted heredoc at the start of a later line is blocked."""
+    assert deny_message('echo hi\n<<EOF cat\nhi\nEOF') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_heredoc_after_safe_one():
+    """A safe heredoc doesn't cover an unsafe one later in the command."""
+    command = "cat <<'A'\nx\nA\ncat <<B\ny\nB"
+    assert deny_message(command) == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+def test_shift_operator():
+    """<< without whitespace before it is not a heredoc."""
+    assert deny_message('echo $((1<<4))') is None
+
+
+# --- Both checks ---
+
+def test_first_match_selects_message():
+    """When both checks fire, the message is for whichever comes first."""
+    assert deny_message('python -c "x" && cat <<EOF\nEOF') == block_inline_scripts.DENY_PYTHON_C
+    assert deny_message('cat <<EOF\nEOF\npython -c "x"') == block_inline_scripts.DENY_UNQUOTED_HEREDOC
+
+
+# --- End to end ---
+
+def test_end_to_end_non_bash():
+    """Non-Bash tool passes through."""
+    assert deny_message('python -c "print(1)"', tool_name='Write') is None
+
+
+def test_end_to_end_bad_json():
+    """Bad JSON input passes through."""
+    assert run_hook('not json') == {}
+
+
+if __name__ == '__main__':
+    test_funcs = [v for k, v in sorted(globals().items()) if k.startswith('test_') and callable(v)]
+
+    passed = 0
+    failed = 0
+
+    for func in test_funcs:
+        name = func.__name__
+        try:
+            func()
+            passed += 1
+            print(f'  PASS: {name}')
+        except Exception as e:
+            failed += 1
+            print(f'  FAIL: {name}: {e}')
+
+    print(f'\n{passed} passed, {failed} failed')
+    sys.exit(1 if failed else 0)
@@ -6,55 +6,81 @@ and blocks HashKnownHosts=yes in SSH config files. We want proper
 hostnames, not hashed versions.
 """
 
-import json
 import re
 import sys
 
 
+# Pre-encoded reply for the allow path. Deny messages name the offending
+# tool, so those are encoded when they fire.
+ALLOW_RESPONSE = b"{}\n"
+
+# Tool names this hook inspects, as they appear in the raw JSON input
+TOOL_MARKERS = (b'"Bash"', b'"Edit"', b'"Write"', b'"MultiEdit"')
+
+# One simple command invoking an SSH tool, optionally behind sudo/env/nice
+# etc. Group 1 is the tool, group 2 its arguments up to the next operator.
+SSH_TOOL = (
+    r'\s*(?:(?:sudo|env|nice|nohup|command)\s+)*'
+    r'(ssh-keyscan|ssh-keygen|ssh-copy-id|ssh-add|ssh)\b'
+    r'((?:[^&|;`$]|&(?!&)|\$(?!\())*)'
+)
+
+# A simple command starts at the beginning of the string or after a shell
+# operator (&&, ||, |, ;) or a $() / backtick subshell (imperfectly, but good
+# enough). The start of the string is matched separately: with only literal
+# operators in front, the regex engine can skip straight to the next
+# operator character instead of trying the whole pattern at every position.
+# (|| needs no branch of its own, the second | starts a match.)
+LEADING_SSH_TOOL_COMMAND = re.compile(SSH_TOOL)
+SSH_TOOL_COMMAND = re.compile(r'(?:&&|\||;|`|\$\()' + SSH_TOOL)
+
+# -H as a standalone flag or combined with other short flags
+# Examples: -H, -tH, -Ht, -tHr
+# The letters before the H exclude H itself, so the split point is the first
+# H and a long run like -HHHH...H_ can't backtrack quadratically.
+# Searched over a span of the full command, so the flag must follow
+# whitespace (the arguments always start with a separator after the tool).
+HASH_FLAG = re.compile(r'\s-[a-zA-GI-Z]*H[a-zA-Z]*\b')
+
+# HashKnownHosts set to yes/1 in an SSH config line
+HASH_KNOWN_HOSTS_YES = re.compile(r'HashKnownHosts\s+(yes|1)\b')
+
+
+def ssh_tool_commands(command: str):
+    """Yield a match for each SSH tool invocation in a bash command."""
+    match = LEADING_SSH_TOOL_COMMAND.match(command)
+    if match:
+        yield match
+    yield from SSH_TOOL_COMMAND.finditer(command)
+
+
 def check_bash_command(command: str) -> str | None:
     """Check if a bash command uses SSH hostname hashing.
 
     Returns a reason string if blocked, None if allowed.
     """
-    # Split on common shell operators to find individual commands
-    # This handles: cmd1 && cmd2, cmd1 || cmd2, cmd1 | cmd2, cmd1; cmd2
-    # Also handles $() and backtick subshells (imperfectly, but good enough)
-    simple_commands = re.split(r'&&|\|\||\||;|`|\$\(', command)
-
-    for simple_cmd in simple_commands:
-        simple_cmd = simple_cmd.strip()
-
-        # Strip leading sudo/env/nice etc.
-        while True:
-            match = re.match(r'^(?:sudo|env|nice|nohup|command)\s+', simple_cmd)
-            if match:
-                simple_cmd = simple_cmd[match.end():]
-            else:
-                break
-
-        # Check if this is an SSH tool command
-        cmd_match = re.match(r'^(ssh-keyscan|ssh-keygen|ssh-copy-id|ssh-add|ssh)\b', simple_cmd)
-        if not cmd_match:
-            continue
-
-        tool_name = cmd_match.group(1)
-
-        # Now check for -H flag in this specific command's arguments
-        # Parse the rest of the command after the tool name
-        rest = simple_cmd[cmd_match.end():]
-
-        # Look for -H as a standalone flag or combined with other short flags
-        # Examples: -H, -tH, -Ht, -tHr
-        if re.search(r'(?:^|\s)-[a-zA-Z]*H[a-zA-Z]*\b', rest):
+    # Cheap substring test first: every SSH tool name contains "ssh"
+    if 'ssh' not in command:
+        return None
+
+    # A single scan over the command yields each SSH tool invocation
+    # together with its own arguments.
+    for match in ssh_tool_commands(command):
+        # Search this command's arguments in place rather than slicing them
+        # out into a new string
+        start, end = match.span(2)
+
+        # Look for -H in this specific command's arguments
+        if HASH_FLAG.search(command, start, end):
             return (
-                f"BLOCKED: '{tool_name}' with -H flag hashes hostnames.\n"
+                f"BLOCKED: '{match.group(1)}' with -H flag hashes hostnames.\n"
                 f"Remove the -H flag to keep proper hostnames."
             )
 
         # Also check for HashKnownHosts in -o options
-        if re.search(r'HashKnownHosts', rest):
+        if command.find('HashKnownHosts', start, end) != -1:
             return (
-                f"BLOCKED: '{tool_name}' with HashKnownHosts option hashes hostnames.\n"
+                f"BLOCKED: '{match.group(1)}' with HashKnownHosts option hashes hostnames.\n"
                 f"Use -o HashKnownHosts=no or omit the option entirely."
             )
 
@@ -68,12 +94,14 @@ def check_file_edit(tool_input: dict) -> str | None:
     """
     # Check new_text (Edit tool) or content (Write tool)
     text = tool_input.get('new_text', '') or tool_input.get('content', '')
+    if 'HashKnownHosts' not in text:
+        return None
 
     for line in text.splitlines():
         # Skip comment lines (SSH config uses # for comments)
         if line.lstrip().startswith('#'):
             continue
-        if re.search(r'HashKnownHosts\s+(yes|1)\b', line):
+        if HASH_KNOWN_HOSTS_YES.search(line):
             return (
                 "BLOCKED: Do not set HashKnownHosts to yes.\n"
                 "This hashes hostnames making known_hosts unreadable.\n"
@@ -84,11 +112,21 @@ def check_file_edit(tool_input: dict) -> str | None:
 
 
 def main():
+    raw = sys.stdin.buffer.read()
+
+    # Recognise calls to other tools from the raw bytes, without importing
+    # json or decoding the payload.
+    if not any(marker in raw for marker in TOOL_MARKERS):
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    import json
+
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
         # Can't read input, allow the operation
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get('tool_name', '')
@@ -110,9 +148,9 @@ def main():
             },
             "systemMessage": reason,
         }
-        print(json.dumps(result))
+        sys.stdout.buffer.write(json.dumps(result).encode() + b"\n")
     else:
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Tests for block_ssh_hash_hostnames.py hook."""
+
+import io
+import json
+import os
+import sys
+import time
+
+# Import from same directory
+sys.path.insert(0, os.path.dirname(__file__))
+import block_ssh_hash_hostnames
+
+
+def denied(command):
+    return block_ssh_hash_hostnames.check_bash_command(command) is not None
+
+
+def edit_denied(text):
+    return block_ssh_hash_hostnames.check_file_edit({'content': text}) is not None
+
+
+def assert_linear(make_command, check):
+    """Check that check() takes about linear time in the input size.
+
+    Compares the best of three runs at n and 4n characters: linear growth
+    gives about 4x, quadratic about 16x. Absolute times are not compared,
+    so a slow machine doesn't fail the test.
+    """
+    def best_time(n):
+        command = make_command(n)
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            check(command)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    small, large = best_time(5000), best_time(20000)
+    assert large < 8 * small + 0.05, (small, large)
+
+
+# --- -H flag ---
+
+def test_keyscan_hash_flag():
+    """ssh-keyscan -H is blocked."""
+    assert denied('ssh-keyscan -H github.com')
+
+
+def test_keygen_hash_flag():
+    """ssh-keygen -H is blocked."""
+    assert denied('ssh-keygen -H')
+
+
+def test_combined_short_flags():
+    """-H combined with other short flags is blocked."""
+    assert denied('ssh-keyscan -tH rsa github.com')
+    assert denied('ssh-keyscan -Ht rsa github.com')
+
+
+def test_hash_flag_after_other_args():
+    """-H later in the argument list is blocked."""
+    assert denied('ssh-keyscan -p 2222 -H github.com')
+
+
+def test_reason_names_tool():
+    """The reason names the tool that was called."""
+    reason = block_ssh_hash_hostnames.check_bash_command('ssh-keyscan -H host')
+    assert "'ssh-keyscan'" in reason
+
+
+def test_no_hash_flag():
+    """SSH tools without -H are allowed."""
+    assert not denied('ssh-keyscan github.com')
+    assert not denied('ssh-keygen -t ed25519 -f ./tmp/key')
+    assert not denied('ssh host uptime')
+
+
+def test_flag_at_span_edges():
+    """Only the tool's own argument span is searched, up to its end."""
+    assert denied('ssh-keyscan host -H && ls')
+    assert denied('ssh-keyscan host -H; ls')
+    assert not denied('ls -H && ssh-keyscan host')
+    assert not denied('ssh-keyscan host && ls -H')
+
+
+def test_flag_glued_to_tool_name():
+    """'ssh-keygen-H' is not ssh-keygen with a flag, so it is allowed."""
+    assert not denied('ssh-keygen-H')
+
+
+def test_hash_known_hosts_outside_span():
+    """HashKnownHosts in another command is not the SSH tool's option."""
+    assert not denied('ssh-keyscan host && echo HashKnownHosts')
+    assert denied('ssh -o HashKnownHosts=yes host && echo done')
+
+
+def test_long_flag_linear():
+    """A long run of letters after - is scanned in linear time."""
+    assert_linear(lambda n: 'ssh-keyscan -' + 'H' * n + '_', denied)
+
+
+# --- HashKnownHosts ---
+
+def test_hash_known_hosts_option():
+    """-o HashKnownHosts=yes is blocked."""
+    assert denied('ssh -o HashKnownHosts=yes host')
+
+
+# --- Wrappers and operators ---
+
+def test_wrappers():
+    """sudo/env/nice/nohup/command in front of the tool are skipped."""
+    assert denied('sudo ssh-keyscan -H host')
+    assert denied('env nice ssh-keyscan -H host')
+    assert denied('nohup ssh-keyscan -H host')
+    assert denied('command ssh-keygen -H')
+
+
+def test_after_operators():
+    """Tool calls after each shell operator are found."""
+    assert denied('true && ssh-keyscan -H host')
+    assert denied('false || ssh-keyscan -H host')
+    assert denied('echo | ssh-keyscan -H host')
+    assert denied('cd ~; ssh-keyscan -H host')
+    assert denied('echo $(ssh-keyscan -H host)')
+    assert denied('echo `ssh-keyscan -H host`')
+
+
+def test_no_spaces_around_operators():
+    """Operators need no surrounding whitespace."""
+    assert denied('true&&ssh-keyscan -H host')
+    assert denied('cd ~;ssh-keyscan -H host')
+    assert denied('false||ssh-keyscan -H host')
+
+
+def test_leading_whitespace():
+    """A tool call at the start of the command may be indented."""
+    assert denied('  ssh-keyscan -H host')
+    assert denied('\nssh-keygen -H')
+
+
+def test_flag_belongs_to_next_command():
+    """-H on a later, non-SSH command is not the SSH tool's."""
+    assert not denied('ssh-keyscan host && grep -H key file')
+    assert not denied('ssh-keyscan host | sort -H')
+
+
+def test_subshell_argument():
+    """-H inside a $() argument belongs to the subshell's command."""
+    assert not denied('ssh host "ls $(ls -H)"')
+
+
+def test_not_command_start():
+    """An SSH tool name that isn't the command being run is ignored."""
+    assert not denied('echo ssh -H')
+    assert not denied('git commit -m "drop ssh-keyscan -H"')
+
+
+def test_triple_ampersand():
+    """'&&&' is a bash syntax error; the tool after it is still checked."""
+    assert denied('true &&& ssh-keygen -H')
+
+
+# --- Config files ---
+
+def test_config_hash_known_hosts_yes():
+    """HashKnownHosts yes/1 in a config is blocked."""
+    assert edit_denied('Host *\n    HashKnownHosts yes\n')
+    assert edit_denied('HashKnownHosts 1\n')
+
+
+def test_config_hash_known_hosts_no():
+    """HashKnownHosts no in a config is allowed."""
+    assert not edit_denied('Host *\n    HashKnownHosts no\n')
+
+
+def test_config_comment():
+    """Commented-out HashKnownHosts yes is allowed."""
+    assert not edit_denied('# HashKnownHosts yes\n')
+    assert not edit_denied('Host *\n    # HashKnownHosts yes\n')
+
+
+def test_config_unrelated():
+    """Files that don't mention HashKnownHosts are allowed."""
+    assert not edit_denied('Host *\n    User git\n')
+    assert not edit_denied('')
+
+
+# --- End to end ---
+
+def run_hook(stdin):
+    """Run the hook's main() on the given stdin text and return its output."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+    sys.stdout = io.TextIOWrapper(io.BytesIO())
+    try:
+        block_ssh_hash_hostnames.main()
+        sys.stdout.flush()
+        output = sys.stdout.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+    return json.loads(output)
+
+
+def test_end_to_end_bash_deny():
+    """Bash command using -H is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'ssh-keyscan -H github.com >> ~/.ssh/known_hosts'},
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    assert 'ssh-keyscan' in output['systemMessage']
+
+
+def test_end_to_end_write_deny():
+    """Write setting HashKnownHosts yes is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Write',
+        'tool_input': {'file_path': 'config', 'content': 'HashKnownHosts yes\n'},
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+
+
+def test_end_to_end_bash_allow():
+    """Unrelated Bash command passes through."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'ls -la'},
+    }))
+    assert output == {}
+
+
+def test_end_to_end_bad_json():
+    """Bad JSON input passes through."""
+    assert run_hook('not json') == {}
+
+
+if __name__ == '__main__':
+    test_funcs = [v for k, v in sorted(globals().items()) if k.startswith('test_') and callable(v)]
+
+    passed = 0
+    failed = 0
+
+    for func in test_funcs:
+        name = func.__name__
+        try:
+            func()
+            passed += 1
+            print(f'  PASS: {name}')
+        except Exception as e:
+            failed += 1
+            print(f'  FAIL: {name}: {e}')
+
+    print(f'\n{passed} passed, {failed} failed')
+    sys.exit(1 if failed else 0)
@@ -14,7 +14,6 @@ Allows:
   - UserKnownHostsFile=<any real path>  (any file that isn't /dev/null)
 """
 
-import json
 import re
 import sys
 
@@ -51,34 +50,54 @@ ssh -o UserKnownHostsFile=~/.ssh/known_hosts_project user@host
 ```"""
 
 
-# --- Command-line patterns ---
+# Each pattern fuses both checks into one alternation so the text is scanned
+# once; the named group that fired selects the deny message.
+MESSAGES = {
+    'strict_host_key': DENY_STRICT_HOST_KEY,
+    'known_hosts_dev_null': DENY_KNOWN_HOSTS_DEV_NULL,
+}
 
-# -o StrictHostKeyChecking=no (with or without space after -o)
-# Matches: -o StrictHostKeyChecking=no, -oStrictHostKeyChecking=no
-STRICT_HOST_KEY_NO_CLI = re.compile(
-    r'-o\s*StrictHostKeyChecking\s*=\s*no\b',
-    re.IGNORECASE,
-)
+# Pre-encoded reply for the allow path
+ALLOW_RESPONSE = b"{}\n"
 
-# -o UserKnownHostsFile=/dev/null (with or without space after -o)
-KNOWN_HOSTS_DEV_NULL_CLI = re.compile(
-    r'-o\s*UserKnownHostsFile\s*=\s*/dev/null\b',
+# Tool names this hook inspects, as they appear in the raw JSON input
+TOOL_MARKERS = (b'"Bash"', b'"Edit"', b'"Write"')
+
+# --- Command-line patterns ---
+
+CLI_PATTERN = re.compile(
+    # -o StrictHostKeyChecking=no (with or without space after -o)
+    # Matches: -o StrictHostKeyChecking=no, -oStrictHostKeyChecking=no
+    r'(?P<strict_host_key>-o\s*StrictHostKeyChecking\s*=\s*no\b)'
+    r'|'
+    # -o UserKnownHostsFile=/dev/null (with or without space after -o)
+    r'(?P<known_hosts_dev_null>-o\s*UserKnownHostsFile\s*=\s*/dev/null\b)',
     re.IGNORECASE,
 )
 
 # --- Config file patterns ---
 
-# StrictHostKeyChecking no  (SSH config format uses space, not =)
-STRICT_HOST_KEY_NO_CONF = re.compile(
-    r'^\s*StrictHostKeyChecking\s+no\s*$',
+# Whitespace is matched with [^\S\n] (whitespace other than newline) so each
+# match stays on one line. A bare \s* after ^ would let every line start
+# rescan all following blank lines, which is quadratic in the text size.
+CONF_PATTERN = re.compile(
+    # StrictHostKeyChecking no  (SSH config format uses space, not =)
+    r'(?P<strict_host_key>^[^\S\n]*StrictHostKeyChecking[^\S\n]+no[^\S\n]*$)'
+    r'|'
+    # UserKnownHostsFile /dev/null  (SSH config format)
+    r'(?P<known_hosts_dev_null>^[^\S\n]*UserKnownHostsFile[^\S\n]+/dev/null[^\S\n]*$)',
     re.MULTILINE | re.IGNORECASE,
 )
 
-# UserKnownHostsFile /dev/null  (SSH config format)
-KNOWN_HOSTS_DEV_NULL_CONF = re.compile(
-    r'^\s*UserKnownHostsFile\s+/dev/null\s*$',
-    re.MULTILINE | re.IGNORECASE,
-)
+
+def mentions_unsafe_option(text: str) -> bool:
+    """Cheap substring pre-check before running the regexes.
+
+    Both option names are matched case-insensitively, so compare against
+    the case-folded text.
+    """
+    folded = text.casefold()
+    return 'stricthostkeychecking' in folded or 'userknownhostsfile' in folded
 
 
 def check_bash_command(command: str) -> str | None:
@@ -86,11 +105,12 @@ def check_bash_command(command: str) -> str | None:
 
     Returns a denial message if blocked, None if allowed.
     """
-    if STRICT_HOST_KEY_NO_CLI.search(command):
-        return DENY_STRICT_HOST_KEY
+    if not mentions_unsafe_option(command):
+        return None
 
-    if KNOWN_HOSTS_DEV_NULL_CLI.search(command):
-        return DENY_KNOWN_HOSTS_DEV_NULL
+    match = CLI_PATTERN.search(command)
+    if match:
+        return MESSAGES[match.lastgroup]
 
     return None
 
@@ -102,28 +122,34 @@ def check_file_content(tool_input: dict) -> str | None:
     """
     # Check new_string (Edit tool) or content (Write tool)
     text = tool_input.get('new_string', '') or tool_input.get('content', '')
+    if not mentions_unsafe_option(text):
+        return None
 
-    # Filter out comment lines before checking
-    non_comment_lines = []
-    for line in text.splitlines():
-        if not line.lstrip().startswith('#'):
-            non_comment_lines.append(line)
-    filtered = '\n'.join(non_comment_lines)
-
-    if STRICT_HOST_KEY_NO_CONF.search(filtered):
-        return DENY_STRICT_HOST_KEY
-
-    if KNOWN_HOSTS_DEV_NULL_CONF.search(filtered):
-        return DENY_KNOWN_HOSTS_DEV_NULL
+    # Comment lines need no filtering: each pattern only allows whitespace
+    # between the start of the line and the option name, so a match can
+    # never begin on a line starting with '#'.
+    match = CONF_PATTERN.search(text)
+    if match:
+        return MESSAGES[match.lastgroup]
 
     return None
 
 
 def main():
+    raw = sys.stdin.buffer.read()
+
+    # Recognise calls to other tools from the raw bytes, without importing
+    # json or decoding the payload.
+    if not any(marker in raw for marker in TOOL_MARKERS):
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    import json
+
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
-        print(json.dumps({}))
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get('tool_name', '')
@@ -137,15 +163,15 @@ def main():
         reason = check_file_content(tool_input)
 
     if reason:
-        print(json.dumps({
+        sys.stdout.buffer.write(json.dumps({
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
             },
             "systemMessage": reason,
-        }))
+        }).encode() + b"\n")
     else:
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Tests for block_ssh_unsafe_options.py hook."""
+
+import io
+import json
+import os
+import sys
+import time
+
+# Import from same directory
+sys.path.insert(0, os.path.dirname(__file__))
+import block_ssh_unsafe_options
+
+STRICT = block_ssh_unsafe_options.DENY_STRICT_HOST_KEY
+DEV_NULL = block_ssh_unsafe_options.DENY_KNOWN_HOSTS_DEV_NULL
+
+
+def check_bash(command):
+    return block_ssh_unsafe_options.check_bash_command(command)
+
+
+def check_content(text, key='content'):
+    return block_ssh_unsafe_options.check_file_content({key: text})
+
+
+def assert_linear(make_command, check):
+    """Check that check() takes about linear time in the input size.
+
+    Compares the best of three runs at n and 4n characters: linear growth
+    gives about 4x, quadratic about 16x. Absolute times are not compared,
+    so a slow machine doesn't fail the test.
+    """
+    def best_time(n):
+        command = make_command(n)
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            check(command)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    small, large = best_time(5000), best_time(20000)
+    assert large < 8 * small + 0.05, (small, large)
+
+
+# --- Command line ---
+
+def test_cli_strict_host_key_no():
+    """-o StrictHostKeyChecking=no is blocked."""
+    assert check_bash('ssh -o StrictHostKeyChecking=no host') == STRICT
+
+
+def test_cli_no_space_after_o():
+    """-oStrictHostKeyChecking=no is blocked."""
+    assert check_bash('ssh -oStrictHostKeyChecking=no host') == STRICT
+
+
+def test_cli_spaces_around_equals():
+    """Whitespace around = is tolerated."""
+    assert check_bash('ssh -o StrictHostKeyChecking = no host') == STRICT
+
+
+def test_cli_case_insensitive():
+    """Option names and values are matched case-insensitively."""
+    assert check_bash('ssh -o stricthostkeychecking=NO host') == STRICT
+    assert check_bash('ssh -o USERKNOWNHOSTSFILE=/dev/null host') == DEV_NULL
+
+
+def test_cli_known_hosts_dev_null():
+    """-o UserKnownHostsFile=/dev/null is blocked."""
+    assert check_bash('ssh -o UserKnownHostsFile=/dev/null host') == DEV_NULL
+
+
+def test_cli_safe_values():
+    """Safe values are allowed."""
+    assert check_bash('ssh -o StrictHostKeyChecking=accept-new host') is None
+    assert check_bash('ssh -o StrictHostKeyChecking=yes host') is None
+    assert check_bash('ssh -o UserKnownHostsFile=~/.ssh/known_hosts_project host') is None
+
+
+def test_cli_value_prefix():
+    """A value that merely starts with 'no' is not 'no'."""
+    assert check_bash('ssh -o StrictHostKeyChecking=nope host') is None
+
+
+def test_cli_first_match_selects_message():
+    """With both options, the message is for whichever comes first."""
+    assert check_bash(
+        'ssh -o UserKnownHostsFile=/dev/null -o StrictHostKeyChecking=no host'
+    ) == DEV_NULL
+    assert check_bash(
+        'ssh -o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null host'
+    ) == STRICT
+
+
+def test_cli_unrelated():
+    """Commands without either option are allowed."""
+    assert check_bash('ssh host uptime') is None
+    assert check_bash('') is None
+
+
+# --- Config files ---
+
+def test_conf_strict_host_key_no():
+    """StrictHostKeyChecking no in a config is blocked."""
+    assert check_content('Host x\n    StrictHostKeyChecking no\n') == STRICT
+
+
+def test_conf_known_hosts_dev_null():
+    """UserKnownHostsFile /dev/null in a config is blocked."""
+    assert check_content('Host x\n\tUserKnownHostsFile /dev/null\n') == DEV_NULL
+
+
+def test_conf_edit_new_string():
+    """Edit's new_string is checked."""
+    assert check_content('StrictHostKeyChecking no', key='new_string') == STRICT
+
+
+def test_conf_comment():
+    """Commented-out options are allowed."""
+    assert check_content('# StrictHostKeyChecking no\n') is None
+    assert check_content('Host x\n    # UserKnownHostsFile /dev/null\n') is None
+
+
+def test_conf_comment_then_option():
+    """A real option after a commented one is still blocked."""
+    text = '# StrictHostKeyChecking no\nStrictHostKeyChecking no\n'
+    assert check_content(text) == STRICT
+
+
+def test_conf_safe_values():
+    """Safe values in a config are allowed."""
+    assert check_content('StrictHostKeyChecking accept-new\n') is None
+    assert check_content('UserKnownHostsFile ~/.ssh/known_hosts\n') is None
+
+
+def test_conf_case_insensitive():
+    """Config keywords are matched case-insensitively."""
+    assert check_content('stricthostkeychecking No\n') == STRICT
+
+
+def test_conf_value_on_next_line():
+    """A keyword and its value on separate lines is not a setting."""
+    assert check_content('StrictHostKeyChecking\nno\n') is None
+    assert check_content('UserKnownHostsFile\n/dev/null\n') is None
+
+
+def test_conf_only_newline_ends_a_line():
+    """Like ssh, only \\n ends a config line; \\r is whitespace."""
+    assert check_content('StrictHostKeyChecking\rno\n') == STRICT
+    assert check_content('Host a\rStrictHostKeyChecking no\n') is None
+
+
+def test_conf_blank_lines_linear():
+    """Long runs of blank lines are scanned in linear time."""
+    assert_linear(lambda n: '# StrictHostKeyChecking\n' + '\n' * n + 'x', check_content)
+    assert_linear(lambda n: '# StrictHostKeyChecking\n' + ' \n' * n + 'x', check_content)
+
+
+def test_conf_first_match_selects_message():
+    """With both options, the message is for whichever comes first."""
+    text = 'UserKnownHostsFile /dev/null\nStrictHostKeyChecking no\n'
+    assert check_content(text) == DEV_NULL
+
+
+# --- End to end ---
+
+def run_hook(stdin):
+    """Run the hook's main() on the given stdin text and return its output."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+    sys.stdout = io.TextIOWrapper(io.BytesIO())
+    try:
+        block_ssh_unsafe_options.main()
+        sys.stdout.flush()
+        output = sys.stdout.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+    return json.loads(output)
+
+
+def test_end_to_end_bash_deny():
+    """Bash command with an unsafe option is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'ssh -o StrictHostKeyChecking=no host'},
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    assert output['systemMessage'] == STRICT
+
+
+def test_end_to_end_write_deny():
+    """Write adding an unsafe config option is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Write',
+        'tool_input': {
+            'file_path': 'ssh_config',
+            'content': 'UserKnownHostsFile /dev/null\n',
+        },
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    assert output['systemMessage'] == DEV_NULL
+
+
+def test_end_to_end_other_tool():
+    """Other tools pass through."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Read',
+        'tool_input': {'file_path': 'StrictHostKeyChecking=no'},
+    }))
+    assert output == {}
+
+
+def test_end_to_end_bad_json():
+    """Bad JSON input passes through."""
+    assert run_hook('not json') == {}
+
+
+if __name__ == '__main__':
+    test_funcs = [v for k, v in sorted(globals().items()) if k.startswith('test_') and callable(v)]
+
+    passed = 0
+    failed = 0
+
+    for func in test_funcs:
+        name = func.__name__
+        try:
+            func()
+            passed += 1
+            print(f'  PASS: {name}')
+        except Exception as e:
+            failed += 1
+            print(f'  FAIL: {name}: {e}')
+
+    print(f'\n{passed} passed, {failed} failed')
+    sys.exit(1 if failed else 0)
@@ -5,7 +5,6 @@ Stderr contains valuable diagnostic information — errors, warnings, and
 unexpected conditions. Suppressing it hides problems and makes debugging harder.
 """
 
-import json
 import re
 import sys
 
@@ -21,33 +20,48 @@ You attempted to use `2>/dev/null` which hides important diagnostic information.
 - If you need to handle errors, capture stderr to a variable or file for inspection
 - If output is noisy, filter specific known-safe messages rather than suppressing all of stderr"""
 
+# Pre-encoded reply for the (common) allow path
+ALLOW_RESPONSE = b"{}\n"
+
 
 def main():
+    raw = sys.stdin.buffer.read()
+
+    # Only Bash calls can be denied. Recognise everything else from the raw
+    # bytes, without importing json or decoding the payload.
+    if b'"Bash"' not in raw:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    import json
+
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
         # Can't parse input — allow the operation
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get("tool_name", "")
     if tool_name != "Bash":
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     command = input_data.get("tool_input", {}).get("command", "")
-    if PATTERN.search(command):
-        print(json.dumps({
+
+    # Cheap substring test first: almost no command contains "2>" at all
+    if "2>" in command and PATTERN.search(command):
+        sys.stdout.buffer.write(json.dumps({
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
             },
             "systemMessage": DENY_MESSAGE,
-        }))
+        }).encode() + b"\n")
         return
 
     # No match — allow
-    print(json.dumps({}))
+    sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == "__main__":
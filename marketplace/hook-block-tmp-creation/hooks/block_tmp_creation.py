@@ -7,39 +7,74 @@ file-creation patterns targeting /tmp and silently allowing ambiguous or
 read-only cases (letting the normal permission system handle those).
 """
 
-import json
-import re
 import sys
 
 # --- Bash command patterns that create files in /tmp ---
 
-# Redirects: > /tmp/..., >> /tmp/..., 2> /tmp/..., &> /tmp/...
-REDIRECT_TO_TMP = re.compile(r'[0-9&]*>{1,2}\s*"?/tmp/')
+# The patterns are compiled by compile_patterns() the first time a command
+# gets past check_bash's substring test. Most calls are allowed before that,
+# and importing re alone takes about as long as the rest of the startup.
+BASH_CREATION_PATTERN = None
+MKTEMP_DEFAULT_DIR = None
+GIT_MESSAGE_COMMAND = None
 
-# tee /tmp/... (with optional flags)
-TEE_TO_TMP = re.compile(r'\btee\s+(-[a-zA-Z]+\s+)*/tmp/')
 
-# cp/mv ... /tmp/... (the .+\s ensures there's a source arg before /tmp dest)
-CP_MV_TO_TMP = re.compile(r'\b(cp|mv)\b.+\s"?/tmp/')
-
-# mkdir /tmp/... (with optional flags)
-MKDIR_TMP = re.compile(r'\bmkdir\s+(-[a-zA-Z]+\s+)*"?/tmp/')
-
-# touch /tmp/... (with optional flags)
-TOUCH_TMP = re.compile(r'\btouch\s+(-[a-zA-Z]+\s+)*"?/tmp/')
+def compile_patterns():
+    """Import re and compile the Bash command patterns, once."""
+    global BASH_CREATION_PATTERN, MKTEMP_DEFAULT_DIR, GIT_MESSAGE_COMMAND
+    if BASH_CREATION_PATTERN is not None:
+        return
 
-# mktemp detection: present in command
-MKTEMP_PRESENT = re.compile(r'\bmktemp\b')
-# mktemp with -p or --tmpdir pointing to a non-/tmp directory
-MKTEMP_CUSTOM_DIR = re.compile(r'\bmktemp\b.*(?:-p\s+|--tmpdir[= ])(?!"?/tmp)(?!/tmp)')
+    import re
+
+    # Shell syntax is ASCII, so every pattern is compiled with re.ASCII: \s,
+    # \w and \b then test a small table instead of the Unicode database.
+
+    # All creation forms are fused into one alternation so the command is
+    # scanned once. Every branch ends where the /tmp/ path begins.
+    BASH_CREATION_PATTERN = re.compile(
+        r'(?:'
+        # Redirects: > /tmp/..., >> /tmp/..., 2> /tmp/..., &> /tmp/...
+        # The fd or & before > needs no matching: a search finds the >
+        # anyway, and a [0-9&]* prefix would rescan every long run of digits
+        # or &s from each of its positions, which is quadratic.
+        r'>{1,2}\s*"?'
+        r'|'
+        # tee /tmp/... (with optional flags)
+        r'\btee\s+(?:-[a-zA-Z]+\s+)*'
+        r'|'
+        # cp/mv ... /tmp/... (the .+\s ensures there's a source arg before /tmp dest)
+        # Only the first cp/mv on a line needs trying, since any later one
+        # sees a subset of the same text. The lookahead and backreference
+        # commit to it, so a line of many cp/mv words isn't rescanned from
+        # each of them, which is quadratic.
+        r'^(?=(?P<cp_mv>.*?\b(?:cp|mv)\b))(?P=cp_mv).+\s"?'
+        r'|'
+        # mkdir /tmp/... (with optional flags)
+        r'\bmkdir\s+(?:-[a-zA-Z]+\s+)*"?'
+        r'|'
+        # touch /tmp/... (with optional flags)
+        r'\btouch\s+(?:-[a-zA-Z]+\s+)*"?'
+        r')'
+        r'/tmp/',
+        re.MULTILINE | re.ASCII,
+    )
+
+    # A line whose last mktemp is not followed by -p or --tmpdir pointing to
+    # a non-/tmp directory. Checking the last mktemp is enough: a flag after
+    # it also follows every earlier one. The lookahead and backreference make
+    # the jump to the last mktemp atomic, so each line is scanned a bounded
+    # number of times instead of once per mktemp. (?!\s...) stops \s+ from
+    # giving back whitespace to slip past the /tmp test.
+    MKTEMP_DEFAULT_DIR = re.compile(
+        r'^(?=(?P<mktemp>.*\bmktemp\b))(?P=mktemp)'
+        r'(?!.*(?:-p\s+|--tmpdir[= ])(?!\s|"?/tmp))',
+        re.MULTILINE | re.ASCII,
+    )
+
+    # git commands whose message text may mention /tmp without touching it
+    GIT_MESSAGE_COMMAND = re.compile(r'\bgit\s+(commit|tag|notes)\b', re.ASCII)
 
-BASH_CREATION_PATTERNS = [
-    REDIRECT_TO_TMP,
-    TEE_TO_TMP,
-    CP_MV_TO_TMP,
-    MKDIR_TMP,
-    TOUCH_TMP,
-]
 
 DENY_MESSAGE = """\u274c **/tmp creation blocked by hook**
 
@@ -63,79 +98,96 @@ mkdir -p ./tmp
 **Why:** Using `/tmp` triggers permission prompts and scatters files outside the project. \
 A local `tmp/` directory is automatically accessible and keeps everything contained."""
 
-
-def make_deny(message):
-    """Return a deny response with the given system message."""
-    return json.dumps({
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "deny",
-        },
-        "systemMessage": message,
-    })
-
-
-def make_allow():
-    """Return an allow response (empty object = no opinion)."""
-    return json.dumps({})
+# Pre-encoded reply for the (common) allow path; empty object = no opinion
+ALLOW_RESPONSE = b"{}\n"
 
 
 def check_file_path(tool_input):
-    """Check if Write/Edit file_path targets /tmp."""
+    """Return the deny message if Write/Edit file_path targets /tmp."""
     file_path = tool_input.get("file_path", "")
     if file_path.startswith("/tmp/") or file_path == "/tmp":
-        return make_deny(DENY_MESSAGE)
+        return DENY_MESSAGE
     return None
 
 
 def check_bash(command):
-    """Check if a Bash command creates files in /tmp."""
+    """Return the deny message if a Bash command creates files in /tmp."""
+    # Cheap substring test first: every pattern below needs one of these
+    if "/tmp/" not in command and "mktemp" not in command:
+        return None
+
+    compile_patterns()
+
     # Skip commands that contain git commit/tag/notes — any /tmp references
     # are likely in the message text, not actual shell file operations.
-    if re.search(r'\bgit\s+(commit|tag|notes)\b', command):
+    if GIT_MESSAGE_COMMAND.search(command):
         return None
 
-    # Check each creation pattern
-    for pattern in BASH_CREATION_PATTERNS:
-        if pattern.search(command):
-            return make_deny(DENY_MESSAGE)
+    # Check all creation patterns in one pass
+    if BASH_CREATION_PATTERN.search(command):
+        return DENY_MESSAGE
 
-    # mktemp: deny if present without a custom non-/tmp directory
-    if MKTEMP_PRESENT.search(command):
-        if not MKTEMP_CUSTOM_DIR.search(command):
-            return make_deny(DENY_MESSAGE)
+    # mktemp: deny if used without a custom non-/tmp directory. Most
+    # commands that get this far mention /tmp rather than mktemp, and a
+    # substring test rules those out without a regex scan.
+    if "mktemp" in command and MKTEMP_DEFAULT_DIR.search(command):
+        return DENY_MESSAGE
 
     return None
 
 
 def main():
+    raw = sys.stdin.buffer.read()
+
+    # Nothing can be denied unless /tmp or mktemp appears somewhere in the
+    # input, so recognise the common case from the raw bytes before decoding
+    # the payload.
+    if b"/tmp" not in raw and b"mktemp" not in raw:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    # Write/Edit are only denied for a file_path starting with /tmp, so unless
+    # this is a Bash call, some JSON string must start with /tmp. This lets
+    # through file writes whose content merely mentions /tmp.
+    if b'"Bash"' not in raw and b'"/tmp' not in raw:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    import json
+
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
         # Can't parse input -- allow the operation
-        print(make_allow())
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get("tool_name", "")
     tool_input = input_data.get("tool_input", {})
 
+    message = None
+
     # Write/Edit: check file_path
     if tool_name in ("Write", "Edit"):
-        result = check_file_path(tool_input)
-        if result:
-            print(result)
-            return
+        message = check_file_path(tool_input)
 
     # Bash: check command
-    if tool_name == "Bash":
+    elif tool_name == "Bash":
         command = tool_input.get("command", "")
-        result = check_bash(command)
-        if result:
-            print(result)
-            return
+        message = check_bash(command)
+
+    if message:
+        sys.stdout.buffer.write(json.dumps({
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+            },
+            "systemMessage": message,
+        }).encode() + b"\n")
+        return
 
     # No match -- allow
-    print(make_allow())
+    sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Tests for block_tmp_creation.py hook."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Import from same directory
+sys.path.insert(0, os.path.dirname(__file__))
+import block_tmp_creation
+
+HOOK = os.path.join(os.path.dirname(__file__), 'block_tmp_creation.py')
+
+
+def denied(command):
+    return block_tmp_creation.check_bash(command) is not None
+
+
+def path_denied(file_path):
+    return block_tmp_creation.check_file_path({'file_path': file_path}) is not None
+
+
+def assert_linear(make_command, check):
+    """Check that check() takes about linear time in the input size.
+
+    Compares the best of three runs at n and 4n characters: linear growth
+    gives about 4x, quadratic about 16x. Absolute times are not compared,
+    so a slow machine doesn't fail the test.
+    """
+    def best_time(n):
+        command = make_command(n)
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            check(command)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    small, large = best_time(5000), best_time(20000)
+    assert large < 8 * small + 0.05, (small, large)
+
+
+# --- Redirects ---
+
+def test_redirect():
+    """> and >> into /tmp are blocked."""
+    assert denied('echo hi > /tmp/out.txt')
+    assert denied('echo hi >> /tmp/out.txt')
+    assert denied('echo hi >/tmp/out.txt')
+    assert denied('echo hi > "/tmp/out file.txt"')
+
+
+def test_redirect_fd():
+    """2> and &> into /tmp are blocked."""
+    assert denied('make 2> /tmp/err.log')
+    assert denied('make &> /tmp/all.log')
+
+
+def test_redirect_elsewhere():
+    """Redirects outside /tmp are allowed."""
+    assert not denied('echo hi > ./tmp/out.txt')
+    assert not denied('make 2>&1 | tee build.log')
+
+
+def test_redirect_linear():
+    """Long runs of digits or &s before a > are scanned in linear time."""
+    assert_linear(lambda n: '1' * n + ' /tmp/', denied)
+    assert_linear(lambda n: '&' * n + 'x /tmp/', denied)
+
+
+# --- Other creation commands ---
+
+def test_tee():
+    """tee into /tmp is blocked, with or without flags."""
+    assert denied('echo hi | tee /tmp/out.txt')
+    assert denied('echo hi | tee -a /tmp/out.txt')
+
+
+def test_cp_mv():
+    """cp/mv with a /tmp destination is blocked."""
+    assert denied('cp file.txt /tmp/')
+    assert denied('mv -f file.txt "/tmp/file.txt"')
+
+
+def test_cp_mv_from_tmp():
+    """Copying out of /tmp is allowed."""
+    assert not denied('cp /tmp/file.txt ./tmp/')
+
+
+def test_cp_later_on_line():
+    """A /tmp destination after the first cp on a line is still found."""
+    assert denied('cp /tmp/a b && cp c /tmp/d')
+    assert denied('echo cp; mv a /tmp/b')
+
+
+def test_cp_next_line():
+    """Each line is checked from its own first cp."""
+    assert denied('cp /tmp/a b\ncp c /tmp/d')
+
+
+def test_cp_mv_linear():
+    """A line of many cp words is scanned in linear time."""
+    assert_linear(lambda n: '/tmp/ ' + 'cp ' * (n // 3) + 'x', denied)
+
+
+def test_mkdir_touch():
+    """mkdir and touch in /tmp are blocked."""
+    assert denied('mkdir -p /tmp/work/')
+    assert denied('touch /tmp/marker')
+
+
+def test_read_only():
+    """Reading from /tmp is allowed."""
+    assert not denied('cat /tmp/log.txt')
+    assert not denied('ls /tmp/')
+
+
+# --- mktemp ---
+
+def test_mktemp_default_dir():
+    """mktemp without a directory creates its file in /tmp and is blocked."""
+    assert denied('mktemp')
+    assert denied('f=$(mktemp -d)')
+
+
+def test_mktemp_custom_dir():
+    """mktemp with a project-local directory is allowed."""
+    assert not denied('mktemp -p ./tmp')
+    assert not denied('mktemp --tmpdir=./tmp')
+    assert not denied('mktemp --tmpdir ./tmp')
+
+
+def test_mktemp_explicit_tmp():
+    """mktemp -p /tmp and --tmpdir=/tmp are blocked."""
+    assert denied('mktemp -p /tmp')
+    assert denied('mktemp -p "/tmp"')
+    assert denied('mktemp -p  /tmp')
+    assert denied('mktemp --tmpdir=/tmp')
+    assert denied('mktemp --tmpdir /tmp')
+    assert denied('mktemp --tmpdir  /tmp')
+
+
+def test_mktemp_second_without_dir():
+    """A bare mktemp after one with -p on the same line is blocked."""
+    assert denied('mktemp -p ./tmp; mktemp')
+
+
+def test_mktemp_next_line_without_dir():
+    """-p on one line doesn't cover a bare mktemp on the next."""
+    assert denied('mktemp -p ./x\nmktemp')
+
+
+def test_mktemp_each_with_dir():
+    """Several mktemps that each have their own directory are allowed."""
+    assert not denied('mktemp -p ./a\nmktemp -p ./b')
+    assert not denied('A=$(mktemp -p ./a) && B=$(mktemp -p ./b)')
+
+
+def test_mktemp_linear():
+    """A line of many mktemps is scanned in linear time."""
+    assert_linear(lambda n: 'mktemp ' * (n // 7) + '-p ./tmp', denied)
+    assert_linear(lambda n: 'mktemp -p' + ' ' * n + '/tmp', denied)
+
+
+# --- git message commands ---
+
+def test_git_message_commands():
+    """/tmp mentioned in a commit, tag or notes command is allowed."""
+    assert not denied('git commit -m "stop writing > /tmp/log"')
+    assert not denied('git tag -a v1 -m "mktemp fix"')
+    assert not denied('git notes add -m "cp x /tmp/"')
+
+
+# --- File paths ---
+
+def test_file_path():
+    """Write/Edit paths in /tmp are blocked."""
+    assert path_denied('/tmp/notes.txt')
+    assert path_denied('/tmp')
+
+
+def test_file_path_elsewhere():
+    """Paths that merely start with /tmp are allowed."""
+    assert not path_denied('/tmpfile')
+    assert not path_denied('./tmp/notes.txt')
+    assert not path_denied('')
+
+
+# --- End to end ---
+
+def run_hook(stdin):
+    """Run the hook's main() on the given stdin text and return its output."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+    sys.stdout = io.TextIOWrapper(io.BytesIO())
+    try:
+        block_tmp_creation.main()
+        sys.stdout.flush()
+        output = sys.stdout.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+    return json.loads(output)
+
+
+def test_end_to_end_bash_deny():
+    """Bash command writing to /tmp is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'echo hi > /tmp/out.txt'},
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    assert output['systemMessage'] == block_tmp_creation.DENY_MESSAGE
+
+
+def test_end_to_end_write_deny():
+    """Write to a /tmp path is denied."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Write',
+        'tool_input': {'file_path': '/tmp/out.txt', 'content': 'hi'},
+    }))
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+
+
+def test_end_to_end_bash_allow():
+    """Unrelated Bash command passes through."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'ls -la'},
+    }))
+    assert output == {}
+
+
+def imported_modules(stdin):
+    """Run the hook as hooks.json does and return the modules it imports."""
+    result = subprocess.run(
+        [sys.executable, '-S', '-X', 'importtime', HOOK],
+        input=stdin.encode(),
+        capture_output=True,
+        check=True,
+    )
+    return {
+        line.rsplit('|', 1)[1].strip()
+        for line in result.stderr.decode().splitlines()
+        if line.startswith('import time:')
+    }
+
+
+def test_allow_path_imports():
+    """A call allowed from the raw bytes imports neither json nor re."""
+    modules = imported_modules(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'ls -la'},
+    }))
+    assert 'json' not in modules
+    assert 're' not in modules
+
+    modules = imported_modules(json.dumps({
+        'tool_name': 'Bash',
+        'tool_input': {'command': 'echo hi > /tmp/out.txt'},
+    }))
+    assert 'json' in modules
+    assert 're' in modules
+
+
+def test_end_to_end_bad_json():
+    """Bad JSON input passes through."""
+    assert run_hook('not json') == {}
+    assert run_hook('not json /tmp/') == {}
+
+
+def test_end_to_end_write_content_mentions_tmp():
+    """Write whose content merely mentions /tmp passes through."""
+    output = run_hook(json.dumps({
+        'tool_name': 'Write',
+        'tool_input': {'file_path': 'notes.md', 'content': 'see /tmp/x'},
+    }))
+    assert output == {}
+
+
+if __name__ == '__main__':
+    test_funcs = [v for k, v in sorted(globals().items()) if k.startswith('test_') and callable(v)]
+
+    passed = 0
+    failed = 0
+
+    for func in test_funcs:
+        name = func.__name__
+        try:
+            func()
+            passed += 1
+            print(f'  PASS: {name}')
+        except Exception as e:
+            failed += 1
+            print(f'  FAIL: {name}: {e}')
+
+    print(f'\n{passed} passed, {failed} failed')
+    sys.exit(1 if failed else 0)
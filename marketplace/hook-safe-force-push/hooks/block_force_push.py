@@ -8,7 +8,6 @@ Users should use the safe wrapper commands instead:
   git safe-force-push-lease <branch>
 """
 
-import json
 import re
 import sys
 
@@ -33,6 +32,9 @@ git safe-force-push-lease <remote> <branch>
 overwrite other people's work on shared branches. The safe wrappers require
 an explicit branch name to prevent accidents."""
 
+# Pre-encoded reply for the allow path
+ALLOW_RESPONSE = b"{}\n"
+
 # Patterns that match dangerous force-push commands
 # We block:
 #   git push --force (with or without remote, but no branch)
@@ -43,8 +45,15 @@ an explicit branch name to prevent accidents."""
 #   git safe-force-push <branch>
 #   git safe-force-push-lease <branch>
 
+# The safe wrapper commands (also covers git safe-force-push-lease)
+SAFE_FORCE_PUSH_PATTERN = re.compile(r'\bgit\s+safe-force-push')
+
+# Single alternation covering the flag both before and after the remote:
+#   git push --force ...
+#   git push <remote> --force ...
 FORCE_PUSH_PATTERN = re.compile(
     r'\bgit\s+push\s+'
+    r'(?:\S+\s+)?'              # optional remote before the flag
     r'(?:'
     r'--force(?:-with-lease)?'  # --force or --force-with-lease
     r'|'
@@ -52,50 +61,55 @@ FORCE_PUSH_PATTERN = re.compile(
     r')'
 )
 
-# Also catch: git push <remote> --force (flag after remote)
-FORCE_PUSH_AFTER_REMOTE = re.compile(
-    r'\bgit\s+push\s+\S+\s+'
-    r'(?:'
-    r'--force(?:-with-lease)?'
-    r'|'
-    r'-[a-zA-Z]*f[a-zA-Z]*'
-    r')'
-)
-
 
 def main():
+    raw = sys.stdin.buffer.read()
+
+    # Only Bash calls can be denied. Recognise everything else from the raw
+    # bytes, without importing json or decoding the payload.
+    if b'"Bash"' not in raw:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
+    import json
+
     try:
-        input_data = json.load(sys.stdin)
-    except (json.JSONDecodeError, EOFError):
+        input_data = json.loads(raw)
+    except json.JSONDecodeError:
         # Can't parse input -- allow the operation
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     tool_name = input_data.get("tool_name", "")
     if tool_name != "Bash":
-        print(json.dumps({}))
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     command = input_data.get("tool_input", {}).get("command", "")
 
+    # Cheap substring test first: most commands don't push at all
+    if "push" not in command:
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
+        return
+
     # Skip if it's using the safe wrapper commands
-    if re.search(r'\bgit\s+safe-force-push', command):
-        print(json.dumps({}))
+    if SAFE_FORCE_PUSH_PATTERN.search(command):
+        sys.stdout.buffer.write(ALLOW_RESPONSE)
         return
 
     # Check for force-push patterns
-    if FORCE_PUSH_PATTERN.search(command) or FORCE_PUSH_AFTER_REMOTE.search(command):
-        print(json.dumps({
+    if FORCE_PUSH_PATTERN.search(command):
+        sys.stdout.buffer.write(json.dumps({
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
             },
             "systemMessage": DENY_MESSAGE,
-        }))
+        }).encode() + b"\n")
         return
 
     # No match -- allow
-    print(json.dumps({}))
+    sys.stdout.buffer.write(ALLOW_RESPONSE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Tests for block_force_push.py hook."""
+
+import io
+import json
+import os
+import sys
+
+# Import from same directory
+sys.path.insert(0, os.path.dirname(__file__))
+import block_force_push
+
+
+def run_hook(stdin):
+    """Run the hook's main() on the given stdin text and return its output."""
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+    sys.stdout = io.TextIOWrapper(io.BytesIO())
+    try:
+        block_force_push.main()
+        sys.stdout.flush()
+        output = sys.stdout.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+    return json.loads(output)
+
+
+def denied(command, tool_name='Bash'):
+    output = run_hook(json.dumps({
+        'tool_name': tool_name,
+        'tool_input': {'command': command},
+    }))
+    if not output:
+        return False
+    assert output['hookSpecificOutput']['permissionDecision'] == 'deny'
+    assert output['systemMessage'] == block_force_push.DENY_MESSAGE
+    return True
+
+
+# --- Flag before the remote ---
+
+def test_force():
+    """git push --force is blocked."""
+    assert denied('git push --force')
+
+
+def test_force_with_lease():
+    """git push --force-with-lease is blocked."""
+    assert denied('git push --force-with-lease')
+
+
+def test_short_flag():
+    """git push -f is blocked."""
+    assert denied('git push -f')
+
+
+def test_combined_short_flags():
+    """-f combined with other short flags is blocked."""
+    assert denied('git push -uf origin')
+    assert denied('git push -fu origin')
+
+
+def test_force_before_remote():
+    """git push --force origin main is blocked."""
+    assert denied('git push --force origin main')
+
+
+# --- Flag after the remote ---
+
+def test_force_after_remote():
+    """git push origin --force is blocked."""
+    assert denied('git push origin --force')
+
+
+def test_short_flag_after_remote():
+    """git push origin -f is blocked."""
+    assert denied('git push origin -f')
+
+
+def test_lease_after_remote():
+    """git push origin --force-with-lease is blocked."""
+    assert denied('git push origin --force-with-lease')
+
+
+# --- Allowed ---
+
+def test_plain_push():
+    """Ordinary pushes are allowed."""
+    assert not denied('git push')
+    assert not denied('git push origin main')
+    assert not denied('git push -u origin feature')
+
+
+def test_long_flags_without_f():
+    """Long flags are not mistaken for -f."""
+    assert not denied('git push --follow-tags')
+    assert not denied('git push origin --no-verify')
+
+
+def test_safe_wrapper():
+    """The safe wrapper commands are allowed."""
+    assert not denied('git safe-force-push main')
+    assert not denied('git safe-force-push origin main')
+    assert not denied('git safe-force-push-lease main')
+
+
+def test_other_git_commands():
+    """Commands other than git push are allowed."""
+    assert not denied('git fetch --force')
+    assert not denied('git checkout -f main')
+
+
+def test_chained():
+    """A force push later in a compound command is blocked."""
+    assert denied('git add -A && git commit -m x && git push --force')
+
+
+# --- End to end ---
+
+def test_end_to_end_non_bash():
+    """Non-Bash tool passes through."""
+    assert not denied('git push --force', tool_name='Write')
+
+
+def test_end_to_end_bad_json():
+    """Bad JSON input passes through."""
+    assert run_hook('not json') == {}
+
+
+if __name__ == '__main__':
+    test_funcs = [v for k, v in sorted(globals().items()) if k.startswith('test_') and callable(v)]
+
+    passed = 0
+    failed = 0
+
+    for func in test_funcs:
+        name = func.__name__
+        try:
+            func()
+            passed += 1
+            print(f'  PASS: {name}')
+        except Exception as e:
+            failed += 1
+            print(f'  FAIL: {name}: {e}')
+
+    print(f'\n{passed} passed, {failed} failed')
+    sys.exit(1 if failed else 0)
@@ -7,6 +7,7 @@ Claude's behaviour.
 """
 
 import json
+import sys
 
 CONVENTIONS = r"""## Personal Coding Conventions
 
@@ -49,14 +50,17 @@ These conventions apply to all projects unless overridden by project-specific ru
 - When creating or configuring new GitHub repositories, use the `github-setup` skill for standard repository settings and configuration commands."""
 
 
-def main():
-    output = {
-        "hookSpecificOutput": {
-            "hookEventName": "SessionStart",
-            "additionalContext": CONVENTIONS.strip(),
-        }
+# The payload never changes, so encode it once
+OUTPUT = json.dumps({
+    "hookSpecificOutput": {
+        "hookEventName": "SessionStart",
+        "additionalContext": CONVENTIONS.strip(),
     }
-    print(json.dumps(output))
+}).encode() + b"\n"
+
+
+def main():
+    sys.stdout.buffer.write(OUTPUT)
 
 
 if __name__ == "__main__":